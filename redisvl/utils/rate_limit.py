@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple, Type
+
+
+class RateLimiter:
+    """Client-side limiter that paces calls to at most `rate` per `period`
+    seconds.
+
+    Each call reserves the next free slot on a shared schedule and then
+    sleeps until that slot arrives, so sync and async callers (on any event
+    loop) draw from the same budget without bursting past it.
+
+    .. code-block:: python
+
+        limiter = RateLimiter(rate=3000, period=60)
+        limiter.acquire()         # blocking
+        await limiter.aacquire()  # non-blocking
+    """
+
+    def __init__(self, rate: float, period: float = 60.0):
+        if rate <= 0 or period <= 0:
+            raise ValueError("Rate and period must be positive numbers.")
+        self.rate = rate
+        self.period = period
+        self._interval = period / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim the next free slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        return slot - now
+
+    def defer(self, delay: float) -> None:
+        """Push the schedule back so no call is allowed for `delay` seconds,
+        e.g. when the server answers with a `Retry-After` header."""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + delay)
+
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Wait, without blocking the event loop, until a call is allowed."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def retry_after_seconds(exc: Optional[BaseException]) -> Optional[float]:
+    """Read the server-requested delay from an HTTP error's `Retry-After`
+    (or `retry-after-ms`) header, if present."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after") is not None:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        # HTTP-date values are not worth parsing here; fall back instead
+        return None
+    return None
+
+
+def is_transient_error(
+    exc: BaseException,
+    network_errors: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError),
+) -> bool:
+    """Whether an API error is worth retrying: rate limits (429), server
+    errors (5xx) and network failures, i.e. instances of `network_errors`.
+    Anything else, such as a bad request or a bug, fails immediately.
+    """
+    status_code = getattr(exc, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code == 429 or status_code >= 500
+    return isinstance(exc, network_errors)
+
+
+def wait_retry_after(fallback: Callable[[Any], float], max_wait: float = 60.0):
+    """Build a tenacity wait strategy that honors `Retry-After` headers and
+    defers to `fallback` when the server gives no hint."""
+
+    def _wait(retry_state: Any) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        delay = retry_after_seconds(exc)
+        if delay is None:
+            return fallback(retry_state)
+        return min(max(delay, 0.0), max_wait)
+
+    return _wait
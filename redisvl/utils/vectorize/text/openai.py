@@ -1,15 +1,104 @@
+import asyncio
+import base64
+import concurrent.futures
+import hashlib
 import os
-from typing import Any, Callable, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, ClassVar, Coroutine, Dict, List, Optional, Tuple
 
+import numpy as np
 from pydantic.v1 import PrivateAttr
+from redis.exceptions import RedisError
 from tenacity import retry, stop_after_attempt, wait_random_exponential
-from tenacity.retry import retry_if_not_exception_type
-
+from tenacity.retry import retry_if_exception
+
+from redisvl.redis.connection import RedisConnectionFactory
+from redisvl.utils.log import get_logger
+from redisvl.utils.rate_limit import (
+    RateLimiter,
+    is_transient_error,
+    retry_after_seconds,
+    wait_retry_after,
+)
 from redisvl.utils.vectorize.base import BaseVectorizer
 
+logger = get_logger(__name__)
+
 # ignore that openai isn't imported
 # mypy: disable-error-code="name-defined"
 
+# Async OpenAI clients shared by every vectorizer using the same API key, so
+# their HTTP connection pools are reused across instances
+_CLIENT_CACHE: Dict[str, Any] = {}
+
+# Rate limiters shared by every vectorizer using the same API key and budget,
+# since OpenAI enforces limits per account rather than per client object
+_RATE_LIMITERS: Dict[Tuple[str, float], RateLimiter] = {}
+
+# Event loop, running on a daemon thread, that owns all OpenAI HTTP traffic.
+# Sync and async callers alike submit requests to it, so one pool of
+# non-blocking connections serves every thread and every caller's loop.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_THREAD: Optional[threading.Thread] = None
+_LOOP_LOCK = threading.Lock()
+
+# Timeout, in seconds, of a single embedding request
+_REQUEST_TIMEOUT = 120.0
+
+# Interval, in seconds, at which callers waiting on the shared loop check that
+# its thread is still alive, so a dead loop raises instead of hanging them
+_LOOP_CHECK_INTERVAL = 1.0
+
+# Default embedding dimensions of known models; dimensions of any other model
+# are measured once with a probe request and memoized here
+_MODEL_DIMS: Dict[str, int] = {
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+}
+
+
+def _reset_after_fork() -> None:
+    """Drop the loop and clients inherited by a forked child: the thread
+    running the loop does not survive the fork, and pooled connections would
+    be shared with the parent."""
+    global _LOOP, _LOOP_THREAD, _LOOP_LOCK
+    _LOOP = None
+    _LOOP_THREAD = None
+    _LOOP_LOCK = threading.Lock()
+    _CLIENT_CACHE.clear()
+    _RATE_LIMITERS.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _is_transient_openai_error(exc: BaseException) -> bool:
+    """Whether an OpenAI request failure is worth retrying."""
+    from openai import APIConnectionError  # also covers APITimeoutError
+
+    return is_transient_error(
+        exc, network_errors=(APIConnectionError, ConnectionError, TimeoutError)
+    )
+
+
+def _get_loop() -> Tuple[asyncio.AbstractEventLoop, threading.Thread]:
+    """Return the shared OpenAI event loop and the thread running it,
+    (re)starting them when the loop is not running."""
+    global _LOOP, _LOOP_THREAD
+    with _LOOP_LOCK:
+        if _LOOP is not None and _LOOP_THREAD is not None and _LOOP_THREAD.is_alive():
+            return _LOOP, _LOOP_THREAD
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever, name="redisvl-openai", daemon=True
+        )
+        thread.start()
+        _LOOP, _LOOP_THREAD = loop, thread
+        return loop, thread
+
 
 class OpenAITextVectorizer(BaseVectorizer):
     """The OpenAITextVectorizer class utilizes OpenAI's API to generate
@@ -43,11 +132,33 @@ class OpenAITextVectorizer(BaseVectorizer):
 
     """
 
-    _client: Any = PrivateAttr()
-    _aclient: Any = PrivateAttr()
+    _client_key: str = PrivateAttr()
+    _client_factory: Callable = PrivateAttr()
+    _cache: "OrderedDict[tuple, np.ndarray]" = PrivateAttr()
+    _cache_maxsize: int = PrivateAttr()
+    _cache_lock: Any = PrivateAttr()
+    _dtype: Any = PrivateAttr()
+    _rate_per_minute: Optional[float] = PrivateAttr()
+    _redis_client: Any = PrivateAttr(default=None)
+    _aredis_client: Any = PrivateAttr(default=None)
+    _cache_ttl: Optional[int] = PrivateAttr(default=None)
+
+    DTYPES: ClassVar[Dict[str, Any]] = {
+        "float16": np.float16,
+        "float32": np.float32,
+        "float64": np.float64,
+    }
 
     def __init__(
-        self, model: str = "text-embedding-ada-002", api_config: Optional[Dict] = None
+        self,
+        model: str = "text-embedding-ada-002",
+        api_config: Optional[Dict] = None,
+        cache_maxsize: int = 1024,
+        dtype: str = "float32",
+        rate_per_minute: Optional[int] = None,
+        redis_url: Optional[str] = None,
+        connection_args: Dict[str, Any] = {},
+        cache_ttl: Optional[int] = None,
     ):
         """Initialize the OpenAI vectorizer.
 
@@ -56,22 +167,60 @@ class OpenAITextVectorizer(BaseVectorizer):
                 'text-embedding-ada-002'.
             api_config (Optional[Dict], optional): Dictionary containing the
                 API key. Defaults to None.
+            cache_maxsize (int, optional): Maximum number of embeddings to
+                keep in the in-process LRU cache. Set to 0 to disable caching.
+                Defaults to 1024.
+            dtype (str, optional): Datatype of the byte strings returned when
+                `as_buffer=True`. One of 'float16', 'float32', 'float64' or
+                'bfloat16'. Defaults to 'float32'.
+            rate_per_minute (Optional[int], optional): Maximum number of
+                embedding requests to send per minute. Requests beyond the
+                budget wait client-side instead of triggering rate limit
+                errors. Defaults to None (no pacing).
+            redis_url (Optional[str], optional): URL of a Redis instance used
+                to persist embeddings across processes, keyed by model and a
+                digest of the text. The async client is bound to the first
+                event loop that uses it; from any other loop, `aembed` and
+                `aembed_many` skip the cache and call the API directly.
+                Defaults to None (no persistence).
+            connection_args (Dict[str, Any], optional): The connection
+                arguments for the redis clients. Must not set
+                `decode_responses`. Defaults to {}.
+            cache_ttl (Optional[int], optional): The time-to-live, in seconds,
+                of embeddings persisted in Redis. Defaults to None.
 
         Raises:
-            ImportError: If the openai library is not installed.
-            ValueError: If the OpenAI API key is not provided.
+            ImportError: If the openai library is not installed, or if
+                'bfloat16' is requested without the ml_dtypes library.
+            ValueError: If the OpenAI API key is not provided, or if the
+                dtype is not supported.
         """
+        self._dtype = self._resolve_dtype(dtype)
+        if rate_per_minute is not None and rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be a positive number")
+        self._rate_per_minute = rate_per_minute
         self._initialize_clients(api_config)
         super().__init__(model=model, dims=self._set_model_dims(model))
+        self._cache = OrderedDict()
+        self._cache_maxsize = cache_maxsize
+        self._cache_lock = threading.Lock()
+        if redis_url:
+            self._redis_client = RedisConnectionFactory.get_redis_connection(
+                redis_url, **connection_args
+            )
+            self._aredis_client = RedisConnectionFactory.get_async_redis_connection(
+                redis_url, **connection_args
+            )
+            self._cache_ttl = cache_ttl
 
     def _initialize_clients(self, api_config: Optional[Dict]):
         """
-        Setup the OpenAI clients using the provided API key or an
+        Setup the OpenAI client using the provided API key or an
         environment variable.
         """
         # Dynamic import of the openai module
         try:
-            from openai import AsyncOpenAI, OpenAI
+            from openai import AsyncOpenAI
         except ImportError:
             raise ImportError(
                 "OpenAI vectorizer requires the openai library. \
@@ -89,13 +238,42 @@ class OpenAITextVectorizer(BaseVectorizer):
                     environment variable."
             )
 
-        self._client = OpenAI(api_key=api_key)
-        self._aclient = AsyncOpenAI(api_key=api_key)
+        self._client_key = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+        # SDK retries would bypass the shared rate limiter and multiply with
+        # the per-batch retries in _aembed_batch, so leave retrying to those
+        self._client_factory = lambda: AsyncOpenAI(
+            api_key=api_key, timeout=_REQUEST_TIMEOUT, max_retries=0
+        )
+
+    def _get_client(self) -> Any:
+        """Return the shared async client for this API key, creating it if it
+        is not cached (first use, or after a fork)."""
+        client = _CLIENT_CACHE.get(self._client_key)
+        if client is None:
+            client = _CLIENT_CACHE.setdefault(self._client_key, self._client_factory())
+        return client
+
+    def _get_rate_limiter(self) -> Optional[RateLimiter]:
+        """Return the rate limiter shared by vectorizers with this API key and
+        budget, or None when requests are not paced."""
+        if not self._rate_per_minute:
+            return None
+        key = (self._client_key, self._rate_per_minute)
+        limiter = _RATE_LIMITERS.get(key)
+        if limiter is None:
+            limiter = _RATE_LIMITERS.setdefault(key, RateLimiter(self._rate_per_minute))
+        return limiter
 
     def _set_model_dims(self, model) -> int:
+        if model in _MODEL_DIMS:
+            return _MODEL_DIMS[model]
         try:
             embedding = (
-                self._client.embeddings.create(input=["dimension test"], model=model)
+                self._run(
+                    self._get_client().embeddings.create(
+                        input=["dimension test"], model=model
+                    )
+                )
                 .data[0]
                 .embedding
             )
@@ -104,56 +282,397 @@ class OpenAITextVectorizer(BaseVectorizer):
         except Exception as e:  # pylint: disable=broad-except
             # fall back (TODO get more specific)
             raise ValueError(f"Error setting embedding model dimensions: {str(e)}")
-        return len(embedding)
+        _MODEL_DIMS[model] = len(embedding)
+        return _MODEL_DIMS[model]
+
+    def _resolve_dtype(self, dtype: str) -> Any:
+        """Map a dtype name onto the numpy type used for byte strings."""
+        if dtype == "bfloat16":
+            try:
+                import ml_dtypes
+            except ImportError:
+                raise ImportError(
+                    "The bfloat16 dtype requires the ml_dtypes library. \
+                        Please install with `pip install ml_dtypes`"
+                )
+            return ml_dtypes.bfloat16
+        if dtype not in self.DTYPES:
+            raise ValueError(
+                f"Invalid dtype {dtype}. Must be one of "
+                f"{list(self.DTYPES) + ['bfloat16']}"
+            )
+        return self.DTYPES[dtype]
+
+    def _process_embedding(self, embedding: Any, as_buffer: bool):
+        if as_buffer:
+            return np.asarray(embedding, dtype=self._dtype).tobytes()
+        return embedding.tolist()
+
+    def _cache_get(self, text: str) -> Optional[np.ndarray]:
+        """Return the cached embedding for `text`, if any."""
+        if self._cache_maxsize <= 0:
+            return None
+        key = (self.model, text)
+        with self._cache_lock:
+            embedding = self._cache.get(key)
+            if embedding is None:
+                return None
+            self._cache.move_to_end(key)
+        return embedding
+
+    def _cache_set(self, text: str, embedding: np.ndarray):
+        """Cache the embedding for `text`, evicting the least recently used
+        entry once the cache is full."""
+        if self._cache_maxsize <= 0:
+            return
+        # copy rows out of their response matrix so a cached row never pins
+        # the rest of the batch in memory
+        array = embedding.copy()
+        array.flags.writeable = False
+        key = (self.model, text)
+        with self._cache_lock:
+            self._cache[key] = array
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_maxsize:
+                self._cache.popitem(last=False)
+
+    def _response_to_array(self, response: Any) -> np.ndarray:
+        """Convert every embedding in an API response into the rows of one
+        read-only float32 matrix.
+
+        Embeddings are requested base64 encoded, so their raw float32 bytes
+        are decoded and viewed as a matrix without ever creating a Python
+        float per component.
+        """
+        data = response.data
+        if data and not isinstance(data[0].embedding, str):
+            # servers that ignore encoding_format still return float lists
+            array = np.asarray([r.embedding for r in data], dtype=np.float32)
+            array.flags.writeable = False
+            return array
+        raw = b"".join(base64.b64decode(r.embedding) for r in data)
+        # the API sends little-endian float32 regardless of the host
+        return np.frombuffer(raw, dtype="<f4").reshape(len(data), -1)
+
+    def _process_embeddings(self, embeddings: List[np.ndarray], as_buffer: bool):
+        """Convert the embeddings of one call to the output format in bulk."""
+        if not embeddings:
+            return []
+        # gather every row into one contiguous matrix, cast once, and only
+        # materialize per-vector objects at the API boundary
+        matrix = np.stack(embeddings)
+        if as_buffer:
+            return [row.tobytes() for row in matrix.astype(self._dtype, copy=False)]
+        return matrix.tolist()
+
+    def _lookup_cached(self, texts: List[str]) -> Tuple[List, Dict[str, List[int]]]:
+        """Resolve `texts` against the cache, returning the embeddings found
+        (None for misses) and a mapping of each distinct missing text to the
+        positions it occupies, so duplicates are only embedded once."""
+        embeddings: List = [None] * len(texts)
+        misses: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if text in misses:
+                misses[text].append(i)
+                continue
+            embeddings[i] = self._cache_get(text)
+            if embeddings[i] is None:
+                misses[text] = [i]
+        return embeddings, misses
+
+    def _redis_key(self, text: str) -> str:
+        """Build the Redis key under which the embedding of `text` persists."""
+        digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        return f"openai:{self.model}:{digest}"
+
+    def _restore_persisted(
+        self,
+        embeddings: List,
+        misses: Dict[str, List[int]],
+        values: List[Optional[bytes]],
+    ):
+        """Fill in the misses found in Redis, in the order of `misses`, and
+        drop them from `misses`."""
+        for text, value in zip(list(misses), values):
+            if value is None:
+                continue
+            embedding = np.frombuffer(value, dtype="<f4")
+            self._cache_set(text, embedding)
+            for i in misses.pop(text):
+                embeddings[i] = embedding
+
+    def _queue_persist(self, pipeline: Any, embedded: Dict[str, np.ndarray]):
+        """Queue writes of freshly computed embeddings on a Redis pipeline."""
+        for text, embedding in embedded.items():
+            # stored little-endian so hosts of any byte order can share them
+            value = embedding.astype("<f4", copy=False).tobytes()
+            pipeline.set(self._redis_key(text), value, ex=self._cache_ttl)
+        return pipeline
+
+    def _store_embedded(
+        self,
+        embeddings: List,
+        misses: Dict[str, List[int]],
+        embedded: Dict[str, np.ndarray],
+    ):
+        """Cache freshly computed embeddings and scatter them to every
+        position their text occupies."""
+        for text, embedding in embedded.items():
+            self._cache_set(text, embedding)
+            for i in misses[text]:
+                embeddings[i] = embedding
+
+    def _run(self, coro: Coroutine) -> Any:
+        """Run a coroutine on the shared OpenAI loop and block for its result."""
+        loop, thread = _get_loop()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            while True:
+                try:
+                    return future.result(timeout=_LOOP_CHECK_INTERVAL)
+                except concurrent.futures.TimeoutError:
+                    if not thread.is_alive():
+                        raise RuntimeError("The OpenAI event loop stopped running.")
+        finally:
+            # no-op once done; stops abandoned work if the caller gives up
+            future.cancel()
+
+    async def _arun(self, coro: Coroutine) -> Any:
+        """Run a coroutine on the shared OpenAI loop and await its result."""
+        loop, thread = _get_loop()
+        future = asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+        try:
+            while True:
+                done, _ = await asyncio.wait({future}, timeout=_LOOP_CHECK_INTERVAL)
+                if done:
+                    return future.result()
+                if not thread.is_alive():
+                    raise RuntimeError("The OpenAI event loop stopped running.")
+        finally:
+            future.cancel()
+
+    async def _gather_batches(
+        self, batches: List[List[str]], max_concurrency: int
+    ) -> Dict[str, np.ndarray]:
+        """Embed `batches` concurrently, with at most `max_concurrency`
+        requests in flight. Runs on the shared OpenAI loop."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _embed_batch(batch: List[str]) -> np.ndarray:
+            async with semaphore:
+                try:
+                    return await self._aembed_batch(batch)
+                except Exception:
+                    # the whole call fails with this batch, so cancel the
+                    # others before they are sent rather than after
+                    for task in tasks:
+                        if task is not asyncio.current_task():
+                            task.cancel()
+                    raise
+
+        tasks = [asyncio.ensure_future(_embed_batch(b)) for b in batches]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            # cancelled batches hold CancelledError, which is not an Exception
+            if isinstance(result, Exception):
+                raise result
+        embedded: Dict[str, np.ndarray] = {}
+        for batch, result in zip(batches, results):
+            embedded.update(zip(batch, result))
+        return embedded
+
+    def _embed_texts(
+        self,
+        texts: List[str],
+        batch_size: int,
+        max_concurrency: int,
+        max_tokens_per_batch: Optional[int] = None,
+    ) -> List[np.ndarray]:
+        """Embed preprocessed texts, consulting the caches before the API and
+        sending up to `max_concurrency` batches at once."""
+        embeddings, misses = self._lookup_cached(texts)
+        if misses and self._redis_client is not None:
+            try:
+                values = self._redis_client.mget([self._redis_key(t) for t in misses])
+            except RedisError as e:
+                logger.warning(f"Skipping Redis embedding cache lookup: {e}")
+            else:
+                self._restore_persisted(embeddings, misses, values)
+
+        embedded: Dict[str, np.ndarray] = {}
+        if misses:
+            batches = self._token_packed_batches(
+                list(misses), batch_size, max_tokens_per_batch
+            )
+            embedded = self._run(self._gather_batches(batches, max_concurrency))
+        self._store_embedded(embeddings, misses, embedded)
+
+        if embedded and self._redis_client is not None:
+            pipeline = self._redis_client.pipeline(transaction=False)
+            try:
+                self._queue_persist(pipeline, embedded).execute()
+            except RedisError as e:
+                logger.warning(f"Failed to persist embeddings to Redis: {e}")
+        return embeddings
+
+    async def _aembed_texts(
+        self,
+        texts: List[str],
+        batch_size: int,
+        max_concurrency: int,
+        max_tokens_per_batch: Optional[int] = None,
+    ) -> List[np.ndarray]:
+        """Asynchronously embed preprocessed texts, consulting the caches
+        before the API and sending up to `max_concurrency` batches at once."""
+        embeddings, misses = self._lookup_cached(texts)
+        if misses and self._aredis_client is not None:
+            try:
+                values = await self._aredis_client.mget(
+                    [self._redis_key(t) for t in misses]
+                )
+            except (RedisError, RuntimeError) as e:
+                # RuntimeError: the client is bound to another event loop
+                logger.warning(f"Skipping Redis embedding cache lookup: {e}")
+            else:
+                self._restore_persisted(embeddings, misses, values)
+
+        embedded: Dict[str, np.ndarray] = {}
+        if misses:
+            batches = self._token_packed_batches(
+                list(misses), batch_size, max_tokens_per_batch
+            )
+            embedded = await self._arun(self._gather_batches(batches, max_concurrency))
+        self._store_embedded(embeddings, misses, embedded)
+
+        if embedded and self._aredis_client is not None:
+            pipeline = self._aredis_client.pipeline(transaction=False)
+            try:
+                await self._queue_persist(pipeline, embedded).execute()
+            except (RedisError, RuntimeError) as e:
+                logger.warning(f"Failed to persist embeddings to Redis: {e}")
+        return embeddings
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Cheaply and conservatively approximate the token count of `text`.
+
+        ASCII prose averages ~4 characters per token, but code and other
+        symbol-heavy text tokenizes denser, so assume 3. Non-ASCII text (e.g.
+        CJK) often costs a token or more per character, so budget one token
+        per two UTF-8 bytes instead.
+        """
+        if text.isascii():
+            return len(text) // 3 + 1
+        return len(text.encode("utf-8")) // 2 + 1
+
+    def _token_packed_batches(
+        self,
+        texts: List[str],
+        batch_size: int,
+        max_tokens_per_batch: Optional[int] = None,
+    ) -> List[List[str]]:
+        """Pack `texts`, longest first, into batches of similarly sized texts
+        holding at most `batch_size` texts and, when given, roughly
+        `max_tokens_per_batch` tokens. A single text over the budget is sent
+        on its own.
+        """
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        tokens = 0
+        for text in sorted(texts, key=len, reverse=True):
+            text_tokens = self._estimate_tokens(text)
+            if batch and (
+                len(batch) >= batch_size
+                or (
+                    max_tokens_per_batch is not None
+                    and tokens + text_tokens > max_tokens_per_batch
+                )
+            ):
+                batches.append(batch)
+                batch, tokens = [], 0
+            batch.append(text)
+            tokens += text_tokens
+        if batch:
+            batches.append(batch)
+        return batches
 
     @retry(
-        wait=wait_random_exponential(min=1, max=60),
+        wait=wait_retry_after(wait_random_exponential(min=1, max=60)),
         stop=stop_after_attempt(6),
-        retry=retry_if_not_exception_type(TypeError),
+        retry=retry_if_exception(_is_transient_openai_error),
     )
+    async def _aembed_batch(self, batch: List[str]) -> np.ndarray:
+        """Asynchronously embed a single batch of texts, retrying transient
+        API failures."""
+        limiter = self._get_rate_limiter()
+        if limiter:
+            await limiter.aacquire()
+        try:
+            response = await self._get_client().embeddings.create(
+                input=batch, model=self.model, encoding_format="base64"
+            )
+        except Exception as e:
+            delay = retry_after_seconds(e)
+            if limiter and delay:
+                # hold back every request sharing the budget, not just this one
+                limiter.defer(delay)
+            raise
+        return self._response_to_array(response)
+
     def embed_many(
         self,
         texts: List[str],
         preprocess: Optional[Callable] = None,
-        batch_size: int = 10,
+        batch_size: int = 1000,
         as_buffer: bool = False,
+        max_concurrency: int = 8,
+        max_tokens_per_batch: int = 100000,
         **kwargs,
     ) -> List[List[float]]:
         """Embed many chunks of texts using the OpenAI API.
 
+        Batches are sent concurrently, with at most `max_concurrency`
+        requests in flight at any time.
+
         Args:
             texts (List[str]): List of text chunks to embed.
             preprocess (Optional[Callable], optional): Optional preprocessing
                 callable to perform before vectorization. Defaults to None.
-            batch_size (int, optional): Batch size of texts to use when creating
-                embeddings. Defaults to 10.
+            batch_size (int, optional): Maximum number of texts per request.
+                Defaults to 1000 (previously 10); batches are also bounded by
+                `max_tokens_per_batch`.
             as_buffer (bool, optional): Whether to convert the raw embedding
                 to a byte string. Defaults to False.
+            max_concurrency (int, optional): Maximum number of batch requests
+                in flight at once. Defaults to 8.
+            max_tokens_per_batch (int, optional): Approximate token budget of
+                a single request; batches are closed early once it would be
+                exceeded. Defaults to 100000.
 
         Returns:
             List[List[float]]: List of embeddings.
 
         Raises:
             TypeError: If the wrong input type is passed in for the test.
+            ValueError: If max_concurrency or max_tokens_per_batch is not a
+                positive integer.
         """
         if not isinstance(texts, list):
             raise TypeError("Must pass in a list of str values to embed.")
         if len(texts) > 0 and not isinstance(texts[0], str):
             raise TypeError("Must pass in a list of str values to embed.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        if max_tokens_per_batch < 1:
+            raise ValueError("max_tokens_per_batch must be a positive integer.")
 
-        embeddings: List = []
-        for batch in self.batchify(texts, batch_size, preprocess):
-            response = self._client.embeddings.create(input=batch, model=self.model)
-            embeddings += [
-                self._process_embedding(r.embedding, as_buffer) for r in response.data
-            ]
-        return embeddings
+        if preprocess:
+            texts = [preprocess(text) for text in texts]
+
+        embeddings = self._embed_texts(
+            texts, batch_size, max_concurrency, max_tokens_per_batch
+        )
+        return self._process_embeddings(embeddings, as_buffer)
 
-    @retry(
-        wait=wait_random_exponential(min=1, max=60),
-        stop=stop_after_attempt(6),
-        retry=retry_if_not_exception_type(TypeError),
-    )
     def embed(
         self,
         text: str,
@@ -181,59 +700,64 @@ class OpenAITextVectorizer(BaseVectorizer):
 
         if preprocess:
             text = preprocess(text)
-        result = self._client.embeddings.create(input=[text], model=self.model)
-        return self._process_embedding(result.data[0].embedding, as_buffer)
+        embedding = self._embed_texts([text], batch_size=1, max_concurrency=1)[0]
+        return self._process_embedding(embedding, as_buffer)
 
-    @retry(
-        wait=wait_random_exponential(min=1, max=60),
-        stop=stop_after_attempt(6),
-        retry=retry_if_not_exception_type(TypeError),
-    )
     async def aembed_many(
         self,
         texts: List[str],
         preprocess: Optional[Callable] = None,
         batch_size: int = 1000,
         as_buffer: bool = False,
+        max_concurrency: int = 8,
+        max_tokens_per_batch: int = 100000,
         **kwargs,
     ) -> List[List[float]]:
         """Asynchronously embed many chunks of texts using the OpenAI API.
 
+        Batches are sent concurrently, with at most `max_concurrency`
+        requests in flight at any time.
+
         Args:
             texts (List[str]): List of text chunks to embed.
             preprocess (Optional[Callable], optional): Optional preprocessing callable to
                 perform before vectorization. Defaults to None.
-            batch_size (int, optional): Batch size of texts to use when creating
-                embeddings. Defaults to 10.
+            batch_size (int, optional): Maximum number of texts per request.
+                Defaults to 1000 (previously 10); batches are also bounded by
+                `max_tokens_per_batch`.
             as_buffer (bool, optional): Whether to convert the raw embedding
                 to a byte string. Defaults to False.
+            max_concurrency (int, optional): Maximum number of batch requests
+                in flight at once. Defaults to 8.
+            max_tokens_per_batch (int, optional): Approximate token budget of
+                a single request; batches are closed early once it would be
+                exceeded. Defaults to 100000.
 
         Returns:
             List[List[float]]: List of embeddings.
 
         Raises:
             TypeError: If the wrong input type is passed in for the test.
+            ValueError: If max_concurrency or max_tokens_per_batch is not a
+                positive integer.
         """
         if not isinstance(texts, list):
             raise TypeError("Must pass in a list of str values to embed.")
         if len(texts) > 0 and not isinstance(texts[0], str):
             raise TypeError("Must pass in a list of str values to embed.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        if max_tokens_per_batch < 1:
+            raise ValueError("max_tokens_per_batch must be a positive integer.")
 
-        embeddings: List = []
-        for batch in self.batchify(texts, batch_size, preprocess):
-            response = await self._aclient.embeddings.create(
-                input=batch, model=self.model
-            )
-            embeddings += [
-                self._process_embedding(r.embedding, as_buffer) for r in response.data
-            ]
-        return embeddings
+        if preprocess:
+            texts = [preprocess(text) for text in texts]
+
+        embeddings = await self._aembed_texts(
+            texts, batch_size, max_concurrency, max_tokens_per_batch
+        )
+        return self._process_embeddings(embeddings, as_buffer)
 
-    @retry(
-        wait=wait_random_exponential(min=1, max=60),
-        stop=stop_after_attempt(6),
-        retry=retry_if_not_exception_type(TypeError),
-    )
     async def aembed(
         self,
         text: str,
@@ -261,5 +785,5 @@ class OpenAITextVectorizer(BaseVectorizer):
 
         if preprocess:
             text = preprocess(text)
-        result = await self._aclient.embeddings.create(input=[text], model=self.model)
-        return self._process_embedding(result.data[0].embedding, as_buffer)
+        embeddings = await self._aembed_texts([text], batch_size=1, max_concurrency=1)
+        return self._process_embedding(embeddings[0], as_buffer)
@@ -0,0 +1,357 @@
+import asyncio
+import base64
+import hashlib
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("openai")
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+from tenacity import wait_none
+
+from redisvl.utils.vectorize import OpenAITextVectorizer
+from redisvl.utils.vectorize.text import openai as openai_vectorizer
+from redisvl.utils.vectorize.text.openai import (
+    _CLIENT_CACHE,
+    _get_loop,
+    _reset_after_fork,
+)
+
+API_KEY = "test-key"
+
+
+class StubEmbeddings:
+    """Stand-in for `AsyncOpenAI().embeddings` that embeds each text as
+    `[len(text), 1.0, 2.0]` and records the batches it is sent."""
+
+    def __init__(self, as_base64=True):
+        self.as_base64 = as_base64
+        self.batches = []
+
+    async def create(self, input, model, encoding_format=None):
+        self.batches.append(list(input))
+        data = []
+        for text in input:
+            embedding = np.array([len(text), 1.0, 2.0], dtype="<f4")
+            if self.as_base64 and encoding_format == "base64":
+                value = base64.b64encode(embedding.tobytes()).decode()
+            else:
+                value = embedding.tolist()
+            data.append(SimpleNamespace(embedding=value))
+        return SimpleNamespace(data=data)
+
+
+def install_stub(embeddings):
+    key = hashlib.blake2b(API_KEY.encode(), digest_size=16).hexdigest()
+    _CLIENT_CACHE[key] = SimpleNamespace(embeddings=embeddings)
+    return key
+
+
+@pytest.fixture
+def stub():
+    embeddings = StubEmbeddings()
+    key = install_stub(embeddings)
+    yield embeddings
+    _CLIENT_CACHE.pop(key, None)
+
+
+def make_vectorizer(**kwargs):
+    return OpenAITextVectorizer(api_config={"api_key": API_KEY}, **kwargs)
+
+
+def expected(text):
+    return [float(len(text)), 1.0, 2.0]
+
+
+def test_embed_many_restores_input_order(stub):
+    texts = ["a", "bbb", "cc", "dddd"]
+    embeddings = make_vectorizer().embed_many(texts, batch_size=2)
+
+    # batches are formed longest first, results come back in input order
+    assert sorted(stub.batches) == [["cc", "a"], ["dddd", "bbb"]]
+    assert embeddings == [expected(t) for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_aembed_many_restores_input_order(stub):
+    texts = ["a", "bbb", "cc", "dddd"]
+    embeddings = await make_vectorizer().aembed_many(texts, batch_size=2)
+
+    assert sorted(stub.batches) == [["cc", "a"], ["dddd", "bbb"]]
+    assert embeddings == [expected(t) for t in texts]
+
+
+def test_lru_cache_hit(stub):
+    vectorizer = make_vectorizer()
+    assert vectorizer.embed("hello") == expected("hello")
+    assert vectorizer.embed_many(["hello"]) == [expected("hello")]
+    assert stub.batches == [["hello"]]
+
+
+def test_lru_cache_evicts_least_recently_used(stub):
+    vectorizer = make_vectorizer(cache_maxsize=2)
+    for text in ["a", "bb", "ccc"]:
+        vectorizer.embed(text)
+    vectorizer.embed("ccc")
+    vectorizer.embed("a")
+    assert stub.batches == [["a"], ["bb"], ["ccc"], ["a"]]
+
+
+def test_lru_cache_disabled(stub):
+    vectorizer = make_vectorizer(cache_maxsize=0)
+    vectorizer.embed("hello")
+    vectorizer.embed("hello")
+    assert stub.batches == [["hello"], ["hello"]]
+
+
+@pytest.mark.parametrize("dtype", ["float16", "float32", "float64"])
+def test_embed_as_buffer_dtype(stub, dtype):
+    vectorizer = make_vectorizer(dtype=dtype)
+    buffers = vectorizer.embed_many(["a", "bb"], as_buffer=True)
+    assert buffers == [
+        np.array(expected(t), dtype=dtype).tobytes() for t in ["a", "bb"]
+    ]
+    assert vectorizer.embed("a", as_buffer=True) == buffers[0]
+
+
+def test_invalid_dtype(stub):
+    with pytest.raises(ValueError):
+        make_vectorizer(dtype="int8")
+
+
+def test_embed_many_embeds_duplicates_once(stub):
+    texts = ["a", "bb", "a", "bb", "a"]
+    embeddings = make_vectorizer().embed_many(texts)
+
+    assert stub.batches == [["bb", "a"]]
+    assert embeddings == [expected(t) for t in texts]
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the Redis commands used by the vectorizer."""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+
+    def mget(self, keys):
+        if self.fail:
+            raise RedisConnectionError("redis is down")
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.writes = {}
+
+    def set(self, key, value, ex=None):
+        self.writes[key] = value
+        return self
+
+    def execute(self):
+        if self.redis.fail:
+            raise RedisConnectionError("redis is down")
+        self.redis.data.update(self.writes)
+
+
+def make_persistent_vectorizer(redis):
+    vectorizer = make_vectorizer(cache_maxsize=0)
+    vectorizer._redis_client = redis
+    return vectorizer
+
+
+def test_redis_cache_miss_hit_and_write_back(stub):
+    redis = FakeRedis()
+    first = make_persistent_vectorizer(redis).embed_many(["a", "bb"])
+    assert len(redis.data) == 2
+
+    # a fresh vectorizer only sends the text missing from Redis
+    second = make_persistent_vectorizer(redis).embed_many(["bb", "ccc", "a"])
+    assert stub.batches == [["bb", "a"], ["ccc"]]
+    assert first == [expected("a"), expected("bb")]
+    assert second == [expected("bb"), expected("ccc"), expected("a")]
+    assert len(redis.data) == 3
+
+
+def test_redis_failure_falls_back_to_api(stub):
+    vectorizer = make_persistent_vectorizer(FakeRedis(fail=True))
+    assert vectorizer.embed_many(["a", "bb"]) == [expected("a"), expected("bb")]
+    assert stub.batches == [["bb", "a"]]
+
+
+def test_embed_many_packs_batches_by_tokens(stub):
+    # 30 ASCII characters are estimated at 11 tokens each
+    texts = ["x" * 30, "y" * 30, "z" * 30]
+    make_vectorizer().embed_many(texts, batch_size=10, max_tokens_per_batch=25)
+    assert sorted(len(batch) for batch in stub.batches) == [1, 2]
+
+
+def test_estimate_tokens_is_conservative_for_non_ascii(stub):
+    vectorizer = make_vectorizer()
+    # CJK text often costs a token or more per character
+    assert vectorizer._estimate_tokens("日本語のテキスト") >= 8
+
+
+@pytest.mark.parametrize("as_base64", [True, False], ids=["base64", "float-list"])
+def test_embed_many_decodes_response_formats(stub, as_base64):
+    stub.as_base64 = as_base64
+    texts = ["a", "bb", "ccc"]
+    vectorizer = make_vectorizer()
+    assert vectorizer.embed_many(texts) == [expected(t) for t in texts]
+    assert vectorizer.embed_many(texts, as_buffer=True) == [
+        np.array(expected(t), dtype=np.float32).tobytes() for t in texts
+    ]
+
+
+def test_failing_batch_cancels_pending_batches(stub):
+    create = stub.create
+
+    async def failing_create(input, model, encoding_format=None):
+        if "boom" in input[0]:
+            stub.batches.append(list(input))
+            raise ValueError("bad input")
+        return await create(input, model, encoding_format)
+
+    stub.create = failing_create
+    # the failing text is the longest, so its batch is sent first
+    texts = ["boom" * 10] + [f"text {i}" for i in range(100)]
+    with pytest.raises(ValueError):
+        make_vectorizer().embed_many(texts, batch_size=1, max_concurrency=1)
+    assert stub.batches == [["boom" * 10]]
+
+
+class ServiceUnavailable(Exception):
+    status_code = 503
+
+
+def test_failing_batch_is_retried_alone(stub, monkeypatch):
+    monkeypatch.setattr(OpenAITextVectorizer._aembed_batch.retry, "wait", wait_none())
+    create = stub.create
+    failed = []
+
+    async def flaky_create(input, model, encoding_format=None):
+        if input == ["bb"] and not failed:
+            failed.append(input)
+            stub.batches.append(list(input))
+            raise ServiceUnavailable()
+        return await create(input, model, encoding_format)
+
+    stub.create = flaky_create
+    texts = ["ccc", "bb", "a"]
+    embeddings = make_vectorizer().embed_many(texts, batch_size=1)
+
+    assert sorted(stub.batches) == [["a"], ["bb"], ["bb"], ["ccc"]]
+    assert embeddings == [expected(t) for t in texts]
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_max_concurrency_limits_requests_in_flight(stub, max_concurrency):
+    create = stub.create
+    in_flight = []
+    peak = []
+
+    async def slow_create(input, model, encoding_format=None):
+        in_flight.append(input)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(input)
+        return await create(input, model, encoding_format)
+
+    stub.create = slow_create
+    texts = [f"text {i}" for i in range(10)]
+    embeddings = make_vectorizer().embed_many(
+        texts, batch_size=1, max_concurrency=max_concurrency
+    )
+    assert max(peak) == max_concurrency
+    assert embeddings == [expected(t) for t in texts]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"max_concurrency": 0}, {"max_tokens_per_batch": 0}]
+)
+def test_embed_many_invalid_limits(stub, kwargs):
+    vectorizer = make_vectorizer()
+    with pytest.raises(ValueError):
+        vectorizer.embed_many(["a"], **kwargs)
+    assert stub.batches == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs", [{"max_concurrency": 0}, {"max_tokens_per_batch": 0}]
+)
+async def test_aembed_many_invalid_limits(stub, kwargs):
+    vectorizer = make_vectorizer()
+    with pytest.raises(ValueError):
+        await vectorizer.aembed_many(["a"], **kwargs)
+    assert stub.batches == []
+
+
+def test_embed_restarts_stopped_loop(stub):
+    vectorizer = make_vectorizer()
+    vectorizer.embed("a")
+    loop, thread = _get_loop()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+    assert vectorizer.embed("bb") == expected("bb")
+    assert _get_loop()[1] is not thread
+
+
+def test_embed_after_fork_reset(stub):
+    vectorizer = make_vectorizer(cache_maxsize=0)
+    vectorizer.embed("a")
+    _, thread = _get_loop()
+
+    # what a forked child runs: inherited loop and clients are dropped
+    _reset_after_fork()
+    assert not _CLIENT_CACHE
+    install_stub(stub)
+
+    assert vectorizer.embed("a") == expected("a")
+    assert _get_loop()[1] is not thread
+    assert stub.batches == [["a"], ["a"]]
+
+
+def test_embed_raises_when_loop_dies_mid_call(stub, monkeypatch):
+    monkeypatch.setattr(openai_vectorizer, "_LOOP_CHECK_INTERVAL", 0.05)
+
+    async def stop_loop(input, model, encoding_format=None):
+        asyncio.get_running_loop().stop()
+        await asyncio.Event().wait()
+
+    stub.create = stop_loop
+    with pytest.raises(RuntimeError):
+        make_vectorizer().embed("a")
+
+
+class FakeAsyncRedis:
+    """Async Redis client stand-in bound to an event loop that has closed."""
+
+    async def mget(self, keys):
+        raise RuntimeError("Event loop is closed")
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def set(self, key, value, ex=None):
+        return self
+
+    async def execute(self):
+        raise RuntimeError("Event loop is closed")
+
+
+@pytest.mark.asyncio
+async def test_async_redis_on_other_loop_falls_back_to_api(stub):
+    vectorizer = make_vectorizer(cache_maxsize=0)
+    vectorizer._aredis_client = FakeAsyncRedis()
+    embeddings = await vectorizer.aembed_many(["a", "bb"])
+    assert embeddings == [expected("a"), expected("bb")]
+    assert stub.batches == [["bb", "a"]]
@@ -0,0 +1,114 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from redisvl.utils.rate_limit import (
+    RateLimiter,
+    is_transient_error,
+    retry_after_seconds,
+    wait_retry_after,
+)
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code=None, headers=None):
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+def test_rate_limiter_invalid_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def test_rate_limiter_paces_calls():
+    limiter = RateLimiter(rate=20, period=1)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    # first call is free, the next four wait 50ms each
+    assert time.monotonic() - start >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_paces_async_calls():
+    limiter = RateLimiter(rate=20, period=1)
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.aacquire()
+    assert time.monotonic() - start >= 0.2
+
+
+def test_rate_limiter_defer():
+    limiter = RateLimiter(rate=1000, period=1)
+    limiter.defer(0.2)
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+    # deferring by less than the current backlog is a no-op
+    limiter.defer(0)
+    assert limiter._reserve() > 0
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [
+        ({"retry-after": "2"}, 2.0),
+        ({"retry-after-ms": "500"}, 0.5),
+        ({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}, None),
+        ({}, None),
+    ],
+    ids=["seconds", "milliseconds", "http-date", "missing"],
+)
+def test_retry_after_seconds(headers, expected):
+    assert retry_after_seconds(FakeAPIError(429, headers)) == expected
+
+
+def test_retry_after_seconds_without_response():
+    assert retry_after_seconds(ValueError("boom")) is None
+
+
+@pytest.mark.parametrize(
+    "exc,expected",
+    [
+        (FakeAPIError(429), True),
+        (FakeAPIError(503), True),
+        (FakeAPIError(401), False),
+        (FakeAPIError(400), False),
+        (ConnectionError(), True),
+        (TimeoutError(), True),
+        (TypeError(), False),
+        (ValueError(), False),
+    ],
+    ids=[
+        "rate-limit",
+        "server-error",
+        "auth",
+        "bad-request",
+        "network",
+        "timeout",
+        "type",
+        "value",
+    ],
+)
+def test_is_transient_error(exc, expected):
+    assert is_transient_error(exc) == expected
+
+
+def test_is_transient_error_custom_network_errors():
+    class TransportError(Exception):
+        pass
+
+    assert is_transient_error(TransportError(), network_errors=(TransportError,))
+    assert not is_transient_error(ConnectionError(), network_errors=(TransportError,))
+
+
+def test_wait_retry_after_prefers_header():
+    def retry_state(exc):
+        return SimpleNamespace(outcome=SimpleNamespace(exception=lambda: exc))
+
+    wait = wait_retry_after(lambda state: 7.0, max_wait=10)
+    assert wait(retry_state(FakeAPIError(429, {"retry-after": "3"}))) == 3.0
+    assert wait(retry_state(FakeAPIError(429, {"retry-after": "30"}))) == 10
+    assert wait(retry_state(FakeAPIError(503))) == 7.0